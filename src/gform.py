@@ -3,13 +3,17 @@
 
 import logging
 import re
+import shutil
+import sys
+import tempfile
 import time
+from functools import lru_cache
 from os import path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webelement import WebElement
 
 
 class ColoredFormatter(logging.Formatter):
@@ -24,9 +28,10 @@ class ColoredFormatter(logging.Formatter):
     }
 
     def format(self, record):
-        color_code = self.COLOR_CODES.get(
-            record.levelname, self.COLOR_CODES['RESET'])
         message = super().format(record)
+        color_code = self.COLOR_CODES.get(record.levelname)
+        if not color_code:
+            return message
         return f"{color_code}{message}{self.COLOR_CODES['RESET']}"
 
 
@@ -35,33 +40,287 @@ logger.setLevel(logging.DEBUG)
 
 console_handler = logging.StreamHandler()
 
-formatter = ColoredFormatter('%(levelname)s: %(message)s')
+# no ANSI colors when logs are piped to a file or CI
+if sys.stderr.isatty():
+    formatter = ColoredFormatter('%(levelname)s: %(message)s')
+else:
+    formatter = logging.Formatter('%(levelname)s: %(message)s')
 console_handler.setFormatter(formatter)
 
 logger.addHandler(console_handler)
 
+_URL_RE = re.compile(r'^https://')
+
+# resources irrelevant to filling a form, blocked over CDP
+_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.woff*", "*.ttf",
+    "*google-analytics*", "*doubleclick*", "*gstatic.com/recaptcha*",
+]
+
+# Resolves every locator in-browser and fills it in a single round-trip.
+# Choices are looked up by their data attribute first. All question/choice
+# spans are indexed by text in one DOM pass; the X-path is only evaluated
+# when both lookups miss. Returns the X-paths that could
+# not be filled so they can be retried with the regular WebDriver waits.
+_BATCH_FILL_JS = """
+var mappings = arguments[0];
+var entries = [];
+mappings.text_xpaths.forEach(function (xpath, i) {
+    entries.push({
+        kind: 'text',
+        xpath: xpath,
+        value: mappings.text_values[i],
+        span: mappings.text_spans[i],
+        selector: mappings.text_selectors[i]
+    });
+});
+['radio', 'checkbox'].forEach(function (kind) {
+    mappings[kind + '_xpaths'].forEach(function (xpath, i) {
+        entries.push({
+            kind: kind,
+            xpath: xpath,
+            css: mappings[kind + '_css'][i][1],
+            span: mappings[kind + '_spans'][i]
+        });
+    });
+});
+var failed = [];
+var spans = new Map();
+document.querySelectorAll('div[role="listitem"] span').forEach(function (s) {
+    var t = s.textContent.trim();
+    if (t && !spans.has(t)) {
+        spans.set(t, s);
+    }
+});
+function locate(entry) {
+    var choice = entry.css && document.querySelector(entry.css);
+    if (choice) {
+        return choice;
+    }
+    var span = entry.span && spans.get(entry.span);
+    if (span) {
+        var el = null;
+        if (entry.kind === 'text') {
+            var item = span.closest('div[role="listitem"]');
+            el = item && item.querySelector(entry.selector);
+        } else {
+            el = span.closest('label');
+        }
+        if (el) {
+            return el;
+        }
+    }
+    return document.evaluate(
+        entry.xpath, document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+}
+entries.forEach(function (entry) {
+    var el = locate(entry);
+    if (!el) {
+        failed.push(entry.xpath);
+        return;
+    }
+    if (entry.kind === 'text') {
+        el.focus();
+        el.value = entry.value;
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        if (el.value !== entry.value) {
+            failed.push(entry.xpath);
+        }
+        return;
+    }
+    // the checkable element: itself, the label's target or a descendant
+    var target = el.hasAttribute('aria-checked') ? el : (
+        (el.getAttribute('for') && document.getElementById(el.getAttribute('for')))
+        || el.querySelector('[aria-checked]')
+    );
+    if (!target) {
+        failed.push(entry.xpath);
+        return;
+    }
+    if (target.getAttribute('aria-checked') === 'false') {
+        el.click();
+    }
+});
+return failed;
+"""
+
+
+# Snapshot used to detect when the page has settled: document state, number
+# of rendered questions and number of network resources fetched so far.
+_READY_JS = """
+return [
+    document.readyState,
+    document.querySelectorAll('div[role="listitem"]').length,
+    performance.getEntriesByType('resource').length
+];
+"""
+
+
+# Clicks a checkbox (or its label) only if the checkbox is unchecked.
+# Returns whether a click happened; throws if there is nothing to check.
+_CHECK_JS = """
+var l = arguments[0];
+var t = l.hasAttribute('aria-checked') ? l : (
+    (l.getAttribute('for') && document.getElementById(l.getAttribute('for')))
+    || l.querySelector('[aria-checked]')
+);
+if (!t) {
+    throw new Error('No checkbox found for label');
+}
+if (t.getAttribute('aria-checked') === 'false') {
+    l.click();
+    return true;
+}
+return false;
+"""
+
+
+# Sets a text field's value and fires the events Google Forms listens to.
+# Returns whether the field kept the value as given.
+_SET_VALUE_JS = """
+var e = arguments[0];
+e.value = arguments[1];
+e.dispatchEvent(new Event('input', {bubbles: true}));
+e.dispatchEvent(new Event('change', {bubbles: true}));
+return e.value === arguments[1];
+"""
+
+
+_SELENIUM = None
+
+# value of selenium's By.CSS_SELECTOR, so building mappings needs no import
+_CSS_SELECTOR = 'css selector'
+
+
+def _selenium() -> SimpleNamespace:
+    """
+    Import selenium on first use, keeping module import cheap.
+    """
+
+    global _SELENIUM
+    if _SELENIUM is None:
+        from selenium import webdriver
+        from selenium.common.exceptions import (StaleElementReferenceException,
+                                                TimeoutException)
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        _SELENIUM = SimpleNamespace(
+            webdriver=webdriver,
+            StaleElementReferenceException=StaleElementReferenceException,
+            TimeoutException=TimeoutException,
+            By=By,
+            EC=EC,
+            WebDriverWait=WebDriverWait,
+        )
+    return _SELENIUM
+
+
+@lru_cache(maxsize=512)
+def _text_xpath(question: str, types: tuple[str, ...], textarea: bool = False) -> str:
+    """
+    Build the X-path of the input field(s), and optionally the textarea, under a question.
+    """
+
+    item = f'//span[normalize-space(text())="{question}"]/ancestor::div[@role="listitem"][1]'
+    xpaths = []
+    if types:
+        text_types = ' or '.join([f'@type="{type_}"' for type_ in types])
+        xpaths.append(f'{item}//input[{text_types}]')
+    if textarea:
+        xpaths.append(f'{item}//textarea')
+    return ' | '.join(xpaths)
+
+
+@lru_cache(maxsize=512)
+def _text_css(types: tuple[str, ...], textarea: bool = False) -> str:
+    """
+    Build the CSS selector of the input field(s) inside a question's listitem.
+    """
+
+    selectors = [f'input[type="{type_}"]' for type_ in types]
+    if textarea:
+        selectors.append('textarea')
+    return ', '.join(selectors)
+
+
+@lru_cache(maxsize=512)
+def _choice_xpath(choice: str) -> str:
+    """
+    Build the X-path of the label of a radio/checkbox choice.
+    """
+
+    return f'//div[@role="radiogroup" or @role="list"]//span[normalize-space(text())="{choice}"]/ancestor::label[1]'
+
+
+@lru_cache(maxsize=512)
+def _choice_css(choice: str, kind: str) -> str:
+    """
+    Build the CSS selector of a radio/checkbox choice from its data attribute.
+    Radios carry `data-value`, checkboxes `data-answer-value`.
+    """
+
+    value = choice.replace('\\', '\\\\').replace('"', '\\"')
+    if kind == 'radio':
+        return f'div[role="radiogroup"] div[data-value="{value}"]'
+    return f'div[role="list"] div[data-answer-value="{value}"]'
+
 
 class GForm:
     """
     A class to fill out Google Forms using Selenium WebDriver.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+            self,
+            temp_profile: bool = False,
+            visible: bool = False,
+            block_resources: bool = True
+    ) -> None:
         """
         Initialize the GForm class with the Google Form URL.
+
+        Args:
+            temp_profile (bool): Use a throwaway Chrome user data directory, removed on `close()`. Needed when several browsers run at once. Default is False.
+            visible (bool): Show the browser window. Required for interactive fills. Default is False (headless).
+            block_resources (bool): Block images, fonts and trackers the form does not need. Default is True.
         """
 
-        options = webdriver.ChromeOptions()
-        src = path.abspath(path.join(path.dirname(__file__), 'data'))
+        se = _selenium()
+        options = se.webdriver.ChromeOptions()
+        if temp_profile:
+            src = self._temp_dir = tempfile.mkdtemp(prefix='gform_')
+        else:
+            self._temp_dir = None
+            src = path.abspath(path.join(path.dirname(__file__), 'data'))
         options.add_argument(f'--user-data-dir={src}')
-        # options.add_argument('--headless')
+        if not visible:
+            options.add_argument('--headless=new')
+            options.add_argument('--window-size=1280,900')
         # options.add_argument('--no-sandbox')
         options.add_argument('--disable-gpu')
+        options.add_argument('--disable-dev-shm-usage')
         options.add_argument('log-level=3')
         options.add_experimental_option(
             "excludeSwitches", ['enable-automation'])
-        self.driver = webdriver.Chrome(options=options)
+        try:
+            self.driver = se.webdriver.Chrome(options=options)
+        except Exception:
+            if self._temp_dir:
+                shutil.rmtree(self._temp_dir, ignore_errors=True)
+            raise
+        self.driver.implicitly_wait(0)
+        if block_resources:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": _BLOCKED_URLS})
         self.WAIT = 5
+        self.visible = visible
+        self._locator_cache: dict[str, 'WebElement'] = {}
 
     def create_mappings(
             self,
@@ -105,69 +364,234 @@ class GForm:
         }
 
         mappings = {
-            'text': {
-                '<X-path for Email>': 'resp',
-                '<X-path for Name>': 'resp',
-            },
-            'radio': [
-                '<X-path for DMSO>',
-            ],
-            'checkbox': [
-                '<X-path for exp-1>',
-                '<X-path for exp-2>',
-            ],
+            'text_xpaths': ['<X-path for Email>', '<X-path for Name>'],
+            'text_values': ['resp', 'resp'],
+            'text_spans': ['Email', 'Name'],
+            'text_selectors': ['<CSS selector for Email>', '<CSS selector for Name>'],
+            'radio_xpaths': ['<X-path for DMSO>'],
+            'radio_css': [(By.CSS_SELECTOR, '<CSS selector for DMSO>')],
+            'radio_spans': ['DMSO'],
+            'checkbox_xpaths': ['<X-path for exp-1>', '<X-path for exp-2>'],
+            'checkbox_css': [(By.CSS_SELECTOR, '<CSS selector for exp-1>'), ...],
+            'checkbox_spans': ['exp-1', 'exp-2'],
+            'fallbacks': {},
         }
         ```
         """
 
+        # parallel lists, index i of each list describes the same field
         mappings = {
-            'text': {},         # text fields
+            # text fields
+            'text_xpaths': [],
+            'text_values': [],
+            'text_spans': [],       # question text, for the batched fill
+            'text_selectors': [],   # input CSS selector within the question
 
             # choice fields
-            'radio': [],        # radio fields
-            'checkbox': [],     # checkbox fields
+            # CSS locators are tried first by the batched fill, X-paths are the fallback
+            'radio_xpaths': [],     # radio fields
+            'radio_css': [],
+            'radio_spans': [],      # choice text, for the batched fill
+            'checkbox_xpaths': [],  # checkbox fields
+            'checkbox_css': [],
+            'checkbox_spans': [],   # choice text, for the batched fill
 
             'fallbacks': {},    # TODO: fallbacks on failure
         }
 
         for question, meta in rawdata['text'].items():
 
-            if 'types' in meta.keys():
-                text_types = ' or '.join(
-                    [f'@type="{type_}"' for type_ in meta['types']]
-                )
-                mappings['text'][f'//span[contains(text(), "{question}")]/../../../..//input[{text_types}]'] = meta['response']
-
-            if not 'textarea' in meta.keys():
-                meta['textarea'] = True if exhaustive else False
+            types = tuple(meta.get('types', ()))
+            textarea = meta.get('textarea', exhaustive)
+            if not types and not textarea:
+                continue
 
-            if meta['textarea'] == True:
-                key, value = mappings['text'].popitem()
-                mappings['text'][f'{key} | //span[contains(text(), "{question}")]/../../../..//textarea'] = value
+            mappings['text_xpaths'].append(_text_xpath(question, types, textarea))
+            mappings['text_values'].append(meta['response'])
+            mappings['text_spans'].append(question)
+            mappings['text_selectors'].append(_text_css(types, textarea))
 
         for question, meta in rawdata['radio'].items():
             choice = meta['choice']
-            mappings['radio'].append(
-                f'//span[contains(text(), "{choice}")]/../../../../..//label'
-            )
+            mappings['radio_xpaths'].append(_choice_xpath(choice))
+            mappings['radio_css'].append(
+                (_CSS_SELECTOR, _choice_css(choice, 'radio')))
+            mappings['radio_spans'].append(choice)
 
         for question, meta in rawdata['checkbox'].items():
             for choice in meta['choices']:
-                mappings['checkbox'].append(
-                    f'//span[contains(text(), "{choice}")]/../../../../..//label'
-                )
+                mappings['checkbox_xpaths'].append(_choice_xpath(choice))
+                mappings['checkbox_css'].append(
+                    (_CSS_SELECTOR, _choice_css(choice, 'checkbox')))
+                mappings['checkbox_spans'].append(choice)
 
         self.mappings = mappings
         self.url = rawdata.get('url', None)
         return self.mappings
 
+    def _resolve(self, input_locator: str) -> 'WebElement':
+        """
+        Find the element at the X-path, reusing a previously resolved element.
+        """
+
+        input_field = self._locator_cache.get(input_locator)
+        if input_field is None:
+            input_field = self.driver.find_element(
+                _selenium().By.XPATH, input_locator)
+            self._locator_cache[input_locator] = input_field
+        return input_field
+
+    def _on_element(self, input_locator: str, action, *args):
+        """
+        Run `action(element, *args)` on the element at the X-path.
+        A stale cached element is evicted and re-resolved once.
+        """
+
+        try:
+            return action(self._resolve(input_locator), *args)
+        except _selenium().StaleElementReferenceException:
+            self._locator_cache.pop(input_locator, None)
+            return action(self._resolve(input_locator), *args)
+
+    def _type_text(self, input_field: 'WebElement', value: str, verify: bool) -> None:
+        """
+        Type the value into a text field.
+        """
+
+        # write the whole value at once instead of dispatching keystrokes
+        if not self.driver.execute_script(_SET_VALUE_JS, input_field, value):
+            # field rewrote the value (e.g. masked input), simulate typing
+            input_field.clear()
+            input_field.send_keys(value)
+        if __debug__ and verify:
+            actual = self.driver.execute_script(
+                "return arguments[0].value", input_field)
+            assert actual == value, f"Value mismatch: {actual} != {value}"
+
+    def _click_radio(self, input_field: 'WebElement') -> None:
+        """
+        Select a radio choice.
+        """
+
+        if not input_field.is_selected():
+            input_field.click()
+
+    def _click_checkbox(self, input_field: 'WebElement') -> None:
+        """
+        Tick a checkbox choice if it is not ticked yet.
+        Raises if the label has no checkbox to tick.
+        """
+
+        self.driver.execute_script(_CHECK_JS, input_field)
+
+    def _fallback_fill(self, failed: set, verify: bool = False) -> None:
+        """
+        Fill the fields at the given X-paths one element at a time.
+
+        Args:
+            failed (set): X-paths the batched fill could not handle.
+            verify (bool): Read back text values after typing them. Default is False.
+        """
+
+        # a single implicit wait covers every lookup below; reset afterwards
+        # so explicit waits elsewhere are not slowed down
+        self.driver.implicitly_wait(self.WAIT)
+        try:
+            # text fields
+            for input_locator, value in zip(
+                    self.mappings['text_xpaths'], self.mappings['text_values']):
+                if input_locator not in failed:
+                    continue
+                try:
+                    self._on_element(
+                        input_locator, self._type_text, value, verify)
+                except Exception as e:
+                    logger.warning(
+                        f"Could not fill at location: {input_locator}")
+                    continue
+
+            # choice fields - radio
+            # the batched fill already tried the CSS locators, only the
+            # X-paths are retried here
+            for input_locator in self.mappings['radio_xpaths']:
+                if input_locator not in failed:
+                    continue
+                try:
+                    self._on_element(input_locator, self._click_radio)
+                except Exception as e:
+                    logger.warning(
+                        f"Could not fill at location: {input_locator}")
+                    continue
+
+            # choice fields - checkbox
+            for input_locator in self.mappings['checkbox_xpaths']:
+                if input_locator not in failed:
+                    continue
+                try:
+                    self._on_element(input_locator, self._click_checkbox)
+                except Exception as e:
+                    logger.warning(
+                        f"Could not fill at location: {input_locator}")
+                    continue
+        finally:
+            self.driver.implicitly_wait(0)
+
+    def _batch_fill(self) -> set:
+        """
+        Fill all mapped fields with a single script execution in the browser.
+
+        Returns:
+            failed (set): X-paths that could not be filled and need the fallback path.
+        """
+
+        try:
+            failed = set(self.driver.execute_script(
+                _BATCH_FILL_JS, self.mappings))
+        except Exception as e:
+            logger.warning(f"Batched fill failed, falling back: {str(e)}")
+            return {
+                *self.mappings['text_xpaths'],
+                *self.mappings['radio_xpaths'],
+                *self.mappings['checkbox_xpaths'],
+            }
+
+        for input_locator in failed:
+            logger.debug(f"Batched fill missed location: {input_locator}")
+        return failed
+
+    def _wait_until_ready(self) -> None:
+        """
+        Wait (up to `self.WAIT`) until the page is loaded and settled, i.e. the
+        document is complete and neither the rendered questions nor the fetched
+        resources changed between two consecutive 50ms polls.
+        """
+
+        se = _selenium()
+        last = None
+
+        def settled(driver):
+            nonlocal last
+            state = driver.execute_script(_READY_JS)
+            ready = state == last and state[0] == 'complete' and state[1] > 0
+            last = state
+            return ready
+
+        try:
+            se.WebDriverWait(self.driver, self.WAIT, poll_frequency=.05).until(settled)
+        except se.TimeoutException:
+            # still busy in the background, but questions are rendered
+            if not last or last[1] == 0:
+                raise
+            logger.debug("Page did not settle, filling anyway")
+
     def fill(
             self,
             url: str = None,
             submit=True,
             interactive=False,
             review_before_submit=False,
-            clear=False
+            clear=False,
+            verify=False
     ) -> None:
         """
         Fill out the Google Form using the form data mappings and submit the form.
@@ -178,83 +602,52 @@ class GForm:
             interactive (bool): Interactive mode. Prompts user input before proceeding. Default is False.
             review_before_submit (bool): Review the form before submitting. Default is False.
             clear (bool): Clears the form before filling. Default is False. (Experimental)
+            verify (bool): Read back text values filled by the fallback path. Default is False.
 
         Returns:
             t (float): Time taken to fill the form.
 
         Example:
         ```python
-        gform.fill(submit=True, interactive=True, review_before_submit=True, clear=False)
+        with GForm(visible=True) as gform:
+            gform.create_mappings(rawdata)
+            gform.fill(submit=True, interactive=True, review_before_submit=True, clear=False)
         ```
         """
 
         self.url = url if url else self.url
         assert self.url, logger.fatal("URL not provided")
-        assert re.match(r'^https://.*$', self.url), logger.fatal("Invalid URL")
+        assert _URL_RE.match(self.url), logger.fatal("Invalid URL")
+        assert self.visible or not interactive, logger.fatal(
+            "Interactive mode needs a visible browser, use GForm(visible=True)")
+        se = _selenium()
         t = -1
         cancel = False
         try:
             self.driver.get(self.url)
-            if not interactive:
-                time.sleep(.5)
+            self._locator_cache.clear()
             cancel = input(
                 "Press <Enter> to start filling or q to quit >> ") == 'q' if interactive else False
             if cancel:
                 return t
 
+            self._wait_until_ready()
+
             start = time.time()
 
             # handle clearing
             if clear:
-                clear_button = WebDriverWait(self.driver, self.WAIT).until(
-                    EC.element_to_be_clickable(
-                        (By.XPATH, '//span[text()="Clear form"]'))
+                clear_button = se.WebDriverWait(self.driver, self.WAIT).until(
+                    se.EC.element_to_be_clickable(
+                        (se.By.XPATH, '//span[text()="Clear form"]'))
                 )
                 clear_button.click()
 
-            # text fields
-            for input_locator, value in self.mappings['text'].items():
-                try:
-                    input_field = WebDriverWait(self.driver, self.WAIT).until(
-                        EC.element_to_be_clickable((By.XPATH, input_locator))
-                    )
-                    input_field.clear()
-                    input_field.send_keys(value)
-                    assert input_field.get_attribute(
-                        'value') == value, f"Value mismatch: {input_field.get_attribute('value')} != {value}"
-                except Exception as e:
-                    logger.warning(
-                        f"Could not fill at location: {input_locator}")
-                    continue
-
-            # choice fields - radio
-            for input_locator in self.mappings['radio']:
-                try:
-                    input_field = WebDriverWait(self.driver, self.WAIT).until(
-                        EC.element_to_be_clickable((By.XPATH, input_locator))
-                    )
-                    if not input_field.is_selected():
-                        input_field.click()
-                except Exception as e:
-                    logger.warning(
-                        f"Could not fill at location: {input_locator}")
-                    continue
+            failed = self._batch_fill()
 
-            # choice fields - checkbox
-            for input_locator in self.mappings['checkbox']:
-                try:
-                    input_field = WebDriverWait(self.driver, self.WAIT).until(
-                        EC.element_to_be_clickable((By.XPATH, input_locator))
-                    )
-                    fr = input_field.get_attribute('for')
-                    aria_checked = self.driver.find_element(
-                        By.ID, fr).get_attribute('aria-checked')
-                    if aria_checked == 'false':
-                        input_field.click()
-                except Exception as e:
-                    logger.warning(
-                        f"Could not fill at location: {input_locator}")
-                    continue
+            # fallback for fields the batched fill could not handle
+            if failed:
+                self._fallback_fill(failed, verify=verify)
 
             # TODO: fallbacks
 
@@ -264,16 +657,30 @@ class GForm:
                     cancel = input(
                         "Review the form and press <Enter> to submit or 'q' to cancel") == 'q'
                 if not cancel:
-                    submit_button = WebDriverWait(self.driver, self.WAIT).until(
-                        EC.element_to_be_clickable(
-                            (By.XPATH, '//span[text()="Submit"]'))
+                    submit_button = se.WebDriverWait(self.driver, self.WAIT).until(
+                        se.EC.element_to_be_clickable(
+                            (se.By.XPATH, '//span[text()="Submit"]'))
                     )
                     submit_button.click()
             t = time.time() - start
-            input("Press <Enter> to close the browser") if interactive else None
+            input("Press <Enter> to continue") if interactive else None
 
         except Exception as e:
             logger.error(f"An error occurred: {str(e)}")
-        finally:
-            self.driver.quit()
-            return t
+        return t
+
+    def close(self) -> None:
+        """
+        Quit the browser. The driver is kept open between fills so it can be reused.
+        """
+
+        self.driver.quit()
+        if self._temp_dir:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
+
+    def __enter__(self) -> 'GForm':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -1,66 +1,120 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
+from typing import List, Tuple
+
 from gform import GForm, logger
 
-if __name__ == '__main__':
+# one GForm per worker process
+_gform: GForm = None
 
-    INFO = {
-        'name': 'Alex Johnson',
-        'email': 'alex.johnson@example.com',
-        'id': 'REG-2025-001',
-        'organization': 'Tech Research Labs',
-        'ticket_type': ('Standard', 1),
-        'registration_id': 'CONF-2025-STD-001',
-        'sessions': [
-            'AI in Healthcare',
-            'Cloud Computing Trends',
-            'Quantum Computing 101',
-            'Data Privacy and Ethics',
-        ]
-    }
 
-    # Example form data structure
-    form_data = {
+def _worker_gform() -> GForm:
+    global _gform
+    if _gform is None:
+        # separate profile per process, Chrome locks its user data directory
+        _gform = GForm(temp_profile=True)
+        # quit the browser when the worker process exits
+        Finalize(None, _gform.close, exitpriority=10)
+    return _gform
+
+
+def _fill_one(job: Tuple[dict, str], gform: GForm = None) -> float:
+    form_data, url = job
+    gform = gform or _worker_gform()
+    gform.create_mappings(form_data, exhaustive=False)
+    return gform.fill(url=url, submit=True)
+
+
+def fill_forms(jobs: List[Tuple[dict, str]], workers: int = None) -> List[float]:
+    """
+    Fill several forms in parallel, one browser per worker process.
+
+    Args:
+        jobs (list): (form_data, url) tuples to fill.
+        workers (int): Number of worker processes. Default is min(len(jobs), cpu count).
+
+    Returns:
+        times (list): Time taken for each job, -1 on failure.
+    """
+
+    if not jobs:
+        return []
+    workers = workers or min(len(jobs), os.cpu_count() or 1)
+    if workers == 1:
+        # not worth spawning processes, reuse a single browser in-process
+        with GForm() as gform:
+            return [_fill_one(job, gform) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_worker_gform) as pool:
+        return list(pool.map(_fill_one, jobs))
+
+
+def build_form_data(info: dict) -> dict:
+    """
+    Build the form data structure for a single registration record.
+    """
+
+    return {
         'text': {
             'Email': {
                 'types': ['text', 'email'],
-                'response': INFO['email'],
+                'response': info['email'],
             },
             'Full Name': {
                 'types': ['text'],
-                'response': INFO['name'],
+                'response': info['name'],
             },
             'Registration ID': {
                 'types': ['text'],
-                'response': INFO['id'],
+                'response': info['id'],
             },
             'Organization': {
                 'types': ['text'],
-                'response': INFO['organization'],
+                'response': info['organization'],
             },
             'Ticket Reference': {
                 'types': ['text'],
-                'response': INFO['registration_id'],
+                'response': info['registration_id'],
             },
         },
         'checkbox': {
             'Preferred Sessions': {
                 'choices': [
-                    INFO['sessions'][0],
-                    INFO['sessions'][2],
+                    info['sessions'][0],
+                    info['sessions'][2],
                 ],
             },
         },
         'radio': {
             'Ticket Type': {
-                'choice': INFO['ticket_type'][0],
-                'choice_num': INFO['ticket_type'][1],
+                'choice': info['ticket_type'][0],
+                'choice_num': info['ticket_type'][1],
             },
         },
     }
 
-    gform = GForm()
-    gform.create_mappings(form_data, exhaustive=False)
-    t = gform.fill(
-        url='https://forms.gle/z6wBJuZgUuUfbvzV7',
-        submit=True,
-    )
-    logger.info(f"Time taken: {t:.2f} seconds") if t != -1 else None
+
+if __name__ == '__main__':
+
+    URL = 'https://forms.gle/z6wBJuZgUuUfbvzV7'
+
+    INFO = [
+        {
+            'name': 'Alex Johnson',
+            'email': 'alex.johnson@example.com',
+            'id': 'REG-2025-001',
+            'organization': 'Tech Research Labs',
+            'ticket_type': ('Standard', 1),
+            'registration_id': 'CONF-2025-STD-001',
+            'sessions': [
+                'AI in Healthcare',
+                'Cloud Computing Trends',
+                'Quantum Computing 101',
+                'Data Privacy and Ethics',
+            ]
+        },
+    ]
+
+    times = fill_forms([(build_form_data(info), URL) for info in INFO])
+    for info, t in zip(INFO, times):
+        logger.info(f"{info['name']}: time taken: {t:.2f} seconds") if t != -1 else None